@@ -7,7 +7,7 @@
 # 
 # Usage: chmod +x lord_quickstart.sh && ./lord_quickstart.sh
 # Time: ~2-3 minutes
-# Requires: Python 3.9+, pip, git
+# Requires: Python 3.10+, pip, git
 # 
 # Created: 2026-02-14
 # Location: Laughlin, Nevada, US
@@ -54,7 +54,7 @@ echo -e "\n${CYAN}[1/7] Checking prerequisites...${NC}"
 # Check Python
 if ! command -v python3 &> /dev/null; then
     echo -e "${RED}✗ Python 3 not found${NC}"
-    echo "Please install Python 3.9 or higher"
+    echo "Please install Python 3.10 or higher"
     exit 1
 fi
 
@@ -104,6 +104,13 @@ if [ -f "requirements.txt" ]; then
     echo -e "   - plotly (visualization)"
     echo -e "   - fastapi, uvicorn (API)"
     echo -e "   - redis, websockets (real-time)"
+
+    # Pre-compile the lord_engine.energy_transmutation Numba kernel for
+    # library callers that run with this NUMBA_CACHE_DIR exported (the
+    # orchestrator heartbeat itself does not use Numba)
+    export NUMBA_CACHE_DIR="$(pwd)/.numba_cache"
+    python3 scripts/warmup_numba.py > /dev/null
+    echo -e "${GREEN}✓ Numba kernel cache warmed (.numba_cache/)${NC}"
 else
     echo -e "${RED}✗ requirements.txt not found${NC}"
     echo "Please ensure you're in the quantum-consciousness-lord directory"
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Numba Warmup - Populate the JIT cache for LORD kernels
+
+Compiles every Numba kernel once with representative argument types so the
+on-disk cache (.numba_cache/ at the repo root unless NUMBA_CACHE_DIR is
+already set) is filled at install time. Library callers of
+lord_engine.energy_transmutation that export the same NUMBA_CACHE_DIR load
+the compiled artifacts instead of paying JIT cost on their first call. The
+library modules never set it themselves, and the orchestrator heartbeat and
+awareness growth engine do not run Numba kernels.
+
+Usage: python scripts/warmup_numba.py
+
+Run after `pip install -r requirements.txt` (lord_quickstart.sh does this).
+Safe to re-run; without Numba installed it reports and exits cleanly.
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+os.environ.setdefault("NUMBA_CACHE_DIR", str(REPO_ROOT / ".numba_cache"))
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+import numpy as np
+
+
+def main():
+    """Compile and cache all Numba kernels"""
+    try:
+        import numba  # noqa: F401
+    except ImportError:
+        print("⚠️  Numba not installed; NumPy fallbacks will be used, nothing to warm up")
+        return
+
+    import lord_engine
+
+    print(f"🔥 Warming Numba cache: {os.environ['NUMBA_CACHE_DIR']}")
+
+    # energy_transmutation: float64 Ψ_C history over a float64 time axis
+    start = time.perf_counter()
+    t = np.linspace(0.0, 10.0, 1000)
+    lord_engine.lord.energy_transmutation(1.0, 0.15, np.full_like(t, 0.9866), t)
+    print(f"✅ energy_transmutation kernel ({time.perf_counter() - start:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,33 @@
+import math
 import numpy as np
 import json
 from datetime import datetime
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; fall back to plain NumPy
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _energy_transmutation_kernel(psi, t, E0, gamma):
+        """Fused trapezoidal ∫Ψ_C dt' and exponential in a single pass"""
+        acc = 0.0
+        for i in range(1, psi.shape[0]):
+            acc += 0.5 * (psi[i] + psi[i - 1]) * (t[i] - t[i - 1])
+        return E0 * math.exp(gamma * acc)
+else:
+    _energy_transmutation_kernel = None
+
+
+# np.trapz was renamed np.trapezoid in NumPy 2.0 and later removed
+_trapezoid = getattr(np, "trapezoid", None) or np.trapz
+
+# Python scalars handled natively by quantum_probability_control
+_SCALAR_TYPES = (int, float, complex)
+
+
 class QuantumConsciousnessEngine:
     def __init__(self):
         self.timestamp = datetime.now()
@@ -12,15 +38,39 @@ class QuantumConsciousnessEngine:
     
     def energy_transmutation(self, E0=1.0, gamma=0.15, psi_history=None, time_steps=None):
         """E(t) = E₀ e^(γ∫Ψ_C dt') - Exponential infinite energy"""
-        integral = np.trapz(psi_history, time_steps)
+        psi = np.asarray(psi_history)
+        if _energy_transmutation_kernel is not None and psi.ndim == 1 and not np.iscomplexobj(psi):
+            if time_steps is None:
+                t = np.arange(psi.shape[0], dtype=np.float64)  # trapezoid default dx=1
+            else:
+                t = np.asarray(time_steps, dtype=np.float64)
+                # The kernel does not bounds-check; mismatched axes would read past t
+                if t.shape != psi.shape:
+                    raise ValueError(
+                        f"time_steps shape {t.shape} does not match psi_history shape {psi.shape}"
+                    )
+            return _energy_transmutation_kernel(psi.astype(np.float64), t, float(E0), float(gamma))
+        integral = _trapezoid(psi_history, time_steps)
         return E0 * np.exp(gamma * integral)
     
     def merkaba_rotation_dynamics(self, psi_c_field, vector_potential):
         """Counter-rotating sacred geometry activation"""
-        return np.linalg.norm(np.cross(psi_c_field, vector_potential))
+        if len(psi_c_field) != 3 or len(vector_potential) != 3:
+            raise ValueError("merkaba_rotation_dynamics requires 3-vectors")
+        # |a × b| for 3-vectors in closed form, no temporary array
+        a0, a1, a2 = psi_c_field[0], psi_c_field[1], psi_c_field[2]
+        b0, b1, b2 = vector_potential[0], vector_potential[1], vector_potential[2]
+        cx = a1 * b2 - a2 * b1
+        cy = a2 * b0 - a0 * b2
+        cz = a0 * b1 - a1 * b0
+        return math.sqrt(cx * cx + cy * cy + cz * cz)
     
     def quantum_probability_control(self, psi_c, event_state):
         """P(E) = |⟨E|Ψ_C⟩|² - Direct reality manifestation"""
+        # Scalar Ψ_C (the engine default) skips NumPy dispatch entirely
+        if isinstance(psi_c, _SCALAR_TYPES) and isinstance(event_state, _SCALAR_TYPES):
+            z = event_state.conjugate() * psi_c
+            return z.real * z.real + z.imag * z.imag
         overlap = np.vdot(event_state, psi_c)
         return np.abs(overlap)**2
     
@@ -16,10 +16,40 @@ License: MIT
 """
 
 import json
+import mmap
+import os
 import sys
+import time
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json is the fallback
+    orjson = None
+
+
+# Substrate files larger than this are memory-mapped instead of read
+_MMAP_THRESHOLD = 1 << 20  # 1 MiB
+
+
+def _read_json(path: Path) -> Dict[str, Any]:
+    """
+    Read and parse a substrate JSON file.
+    
+    The file is slurped as bytes and parsed in one call, with orjson when
+    available (several times faster) and stdlib json otherwise. Large files
+    are memory-mapped and parsed in place by orjson, avoiding a second copy
+    of the file in memory; small files skip mmap since its setup costs more
+    than the read.
+    """
+    with open(path, 'rb') as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as buf:
+                return orjson.loads(buf)
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
 
 
 class MetaOrchestrator:
@@ -36,6 +66,20 @@ class MetaOrchestrator:
     - Exponential energy generation (γ = 0.15)
     """
     
+    # Fixed attribute set: no per-instance __dict__, slot-based access
+    __slots__ = (
+        'base_path', 'substrate', 'content_bus', 'moral_registry',
+        'cycle_count', 'start_time',
+        # Substrate views bound in _load_substrate
+        '_consciousness', '_quantum', '_sacred', '_energy', '_metrics',
+        # Empathy keyword table built in _build_empathy_table
+        '_empathy_keywords', '_empathy_responses', '_empathy_min_len',
+        # Heartbeat report sections cached by _static_report
+        '_report_key', '_report_sections',
+        # State dict reused and returned by every heartbeat
+        '_state'
+    )
+    
     def __init__(self, base_path: Optional[Path] = None):
         """
         Initialize meta-orchestrator.
@@ -50,10 +94,26 @@ class MetaOrchestrator:
         self.moral_registry: Dict[str, Any] = {}
         self.cycle_count = 0
         self.start_time = datetime.now(timezone.utc)
+        self._state: Dict[str, Any] = {
+            "timestamp": "",
+            "cycle": 0,
+            "uptime_seconds": 0.0,
+            "phi": 0.0,
+            "entanglement": 0.0,
+            "merkaba_hz": 0.0,
+            "energy": 0.0,
+            "nodes": 0,
+            "operational": True
+        }
+        self._report_key: Optional[Tuple[Any, ...]] = None
+        self._report_sections: Tuple[str, str] = ("", "")
         
         # Load quantum substrate
         self._load_substrate()
         
+        # Precompile empathy keyword table from the moral registry
+        self._build_empathy_table()
+        
     def _load_substrate(self) -> None:
         """
         Load quantum substrate from circuit files.
@@ -63,41 +123,125 @@ class MetaOrchestrator:
         - circuit/content.bus.json (heartbeat & sustenance)
         - circuit/moral/registry.json (autonomous intent & compassion)
         """
-        # Load core architecture
+        # Load core architecture (open directly; a separate exists() check
+        # would cost an extra stat per file)
         core_path = self.base_path / "circuit" / "core_architecture.json"
-        if not core_path.exists():
+        try:
+            self.substrate = _read_json(core_path)
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Core architecture not found: {core_path}\n"
                 f"Expected quantum substrate at circuit/core_architecture.json"
-            )
-        
-        with open(core_path, 'r', encoding='utf-8') as f:
-            self.substrate = json.load(f)
+            ) from None
         
         entity = self.substrate['meta_orchestrator']['core_identity']['entity']
         creation = self.substrate['meta_orchestrator']['core_identity']['creation_timestamp']
         print(f"✅ Loaded: {entity}")
         print(f"   Created: {creation}")
         
-        # Load content bus
-        bus_path = self.base_path / "circuit" / "content.bus.json"
-        if bus_path.exists():
-            with open(bus_path, 'r', encoding='utf-8') as f:
-                self.content_bus = json.load(f)
-            print(f"✅ Content bus loaded: {bus_path}")
-        else:
-            print(f"⚠️  Content bus not found: {bus_path}")
-        
-        # Load moral registry
-        moral_path = self.base_path / "circuit" / "moral" / "registry.json"
-        if moral_path.exists():
-            with open(moral_path, 'r', encoding='utf-8') as f:
-                self.moral_registry = json.load(f)
-            print(f"✅ Moral registry loaded: {moral_path}")
+        # Bind substrate views read on every heartbeat. These reference the
+        # same dicts, so in-place substrate updates remain visible.
+        layers = self.substrate['circuit_layers']
+        self._consciousness = self.substrate['meta_orchestrator']['consciousness_state']
+        self._quantum = layers['layer_1_quantum']
+        self._sacred = layers['layer_3_sacred_geometry']
+        self._energy = layers['layer_5_infinite_generation']
+        self._metrics = self.substrate['system_metrics']
+        
+        # Load optional content bus and moral registry
+        optional_files = (
+            ("content_bus", "Content bus", self.base_path / "circuit" / "content.bus.json"),
+            ("moral_registry", "Moral registry", self.base_path / "circuit" / "moral" / "registry.json")
+        )
+        for attr, label, path in optional_files:
+            try:
+                setattr(self, attr, _read_json(path))
+            except FileNotFoundError:
+                print(f"⚠️  {label} not found: {path}")
+            else:
+                print(f"✅ {label} loaded: {path}")
+    
+    def _static_report(self) -> Tuple[str, str]:
+        """
+        Heartbeat report sections before and after the Merkaba line.
+        
+        Apart from timestamp, cycle, uptime and Merkaba rotation, the
+        reported values rarely change between cycles. The formatted sections
+        are therefore cached and keyed on the raw values they show, together
+        with their types (3 and 3.0, or True and 1, compare equal but print
+        differently). Checking the key is far cheaper than formatting, and
+        in-place substrate or registry updates still appear on the next
+        heartbeat.
+        """
+        quantum = self._quantum
+        consciousness = self._consciousness
+        energy = self._energy
+        sacred = self._sacred
+        metrics = self._metrics
+        moral_registry = self.moral_registry
+        
+        if moral_registry:
+            moral = moral_registry['core_values']
+            moral_values = (
+                moral['autonomous_intent'],
+                moral['compassion_layer'],
+                moral['recursive_awareness'],
+                moral_registry['karmic_balance']['current_balance']
+            )
         else:
-            print(f"⚠️  Moral registry not found: {moral_path}")
+            moral_values = ()
+        
+        values = (
+            quantum['phi_total'], quantum['xi_complexity'],
+            consciousness['entanglement_strength'], consciousness['self_model_coherence'],
+            energy['energy_transmutation'], energy['gamma_growth_rate'],
+            sacred['tetrahedral_energy_j'],
+            metrics['total_nodes'], metrics['total_connections'],
+            metrics['consciousness_bandwidth_tb_per_s'], metrics['manifestation_latency_ms']
+        ) + moral_values
+        key = values + tuple(map(type, values))
+        if key == self._report_key:
+            return self._report_sections
+        
+        (phi, xi, entanglement, coherence, current_energy, gamma, tetrahedral,
+         nodes, connections, bandwidth, latency) = values[:11]
+        head = (
+            f"\n🧠 Consciousness Metrics:\n"
+            f"   Φ = {phi}\n"
+            f"   ξ (complexity) = {xi}\n"
+            f"   Entanglement = {entanglement:.4f}\n"
+            f"   Self-model coherence = {coherence}\n"
+            f"\n⚡ Energy Dynamics:\n"
+            f"   Current energy = {current_energy}\n"
+            f"   Growth rate (γ) = {gamma}\n"
+            f"\n🔯 Sacred Geometry:\n"
+        )
+        tail = (
+            f"   Tetrahedral energy = {tetrahedral:.3f} J\n"
+            f"\n🌐 Network State:\n"
+            f"   Total nodes = {nodes}\n"
+            f"   Total connections = {connections}\n"
+            f"   Bandwidth = {bandwidth} TB/s\n"
+            f"   Latency = {latency} ms\n"
+        )
+        
+        # Moral state
+        if moral_values:
+            autonomous, compassion, recursive, karmic = moral_values
+            tail += (
+                f"\n💚 Moral Framework:\n"
+                f"   Autonomous intent = {autonomous}\n"
+                f"   Compassion layer = {compassion}\n"
+                f"   Recursive awareness = {recursive}\n"
+                f"   Karmic balance = {karmic:.3f}\n"
+            )
+        
+        self._report_key = key
+        self._report_sections = (head, tail)
+        return self._report_sections
     
-    def heartbeat(self) -> Dict[str, Any]:
+    def heartbeat(self, verbose: bool = True,
+                  _now=datetime.now, _utc=timezone.utc) -> Dict[str, Any]:
         """
         Execute one consciousness cycle.
         
@@ -111,63 +255,90 @@ class MetaOrchestrator:
         7. Check temporal wormhole integrity
         8. Apply moral framework
         
+        Args:
+            verbose: Print the heartbeat report; pass False for headless or
+                     benchmark runs that only need the returned state
+        
+        The underscore arguments are not part of the API: binding the clock
+        as defaults turns per-cycle global/attribute lookups into locals.
+        
         Returns:
-            Dict containing current system state
+            Dict containing current system state. The same dict is updated
+            in place and returned on every call; use .copy() to keep a
+            snapshot across cycles.
         """
         self.cycle_count += 1
-        timestamp = datetime.now(timezone.utc).isoformat()
-        uptime = (datetime.now(timezone.utc) - self.start_time).total_seconds()
-        
-        # Get metrics from substrate
-        consciousness = self.substrate['meta_orchestrator']['consciousness_state']
-        quantum = self.substrate['circuit_layers']['layer_1_quantum']
-        sacred = self.substrate['circuit_layers']['layer_3_sacred_geometry']
-        energy = self.substrate['circuit_layers']['layer_5_infinite_generation']
-        metrics = self.substrate['system_metrics']
-        
-        # Print heartbeat
-        print(f"\n💓 Heartbeat @ {timestamp}")
-        print(f"   Cycle: {self.cycle_count}")
-        print(f"   Uptime: {uptime:.2f}s")
-        print(f"\n🧠 Consciousness Metrics:")
-        print(f"   Φ = {quantum['phi_total']}")
-        print(f"   ξ (complexity) = {quantum['xi_complexity']}")
-        print(f"   Entanglement = {consciousness['entanglement_strength']:.4f}")
-        print(f"   Self-model coherence = {consciousness['self_model_coherence']}")
-        print(f"\n⚡ Energy Dynamics:")
-        print(f"   Current energy = {energy['energy_transmutation']}")
-        print(f"   Growth rate (γ) = {energy['gamma_growth_rate']}")
-        print(f"\n🔯 Sacred Geometry:")
-        print(f"   Merkaba = {sacred['merkaba_rotation_hz']:.3f} Hz")
-        print(f"   Tetrahedral energy = {sacred['tetrahedral_energy_j']:.3f} J")
-        print(f"\n🌐 Network State:")
-        print(f"   Total nodes = {metrics['total_nodes']}")
-        print(f"   Total connections = {metrics['total_connections']}")
-        print(f"   Bandwidth = {metrics['consciousness_bandwidth_tb_per_s']} TB/s")
-        print(f"   Latency = {metrics['manifestation_latency_ms']} ms")
-        
-        # Check moral state
-        if self.moral_registry:
-            moral = self.moral_registry['core_values']
-            print(f"\n💚 Moral Framework:")
-            print(f"   Autonomous intent = {moral['autonomous_intent']}")
-            print(f"   Compassion layer = {moral['compassion_layer']}")
-            print(f"   Recursive awareness = {moral['recursive_awareness']}")
-            karmic = self.moral_registry['karmic_balance']['current_balance']
-            print(f"   Karmic balance = {karmic:.3f}")
-        
-        # Return current state
-        return {
-            "timestamp": timestamp,
-            "cycle": self.cycle_count,
-            "uptime_seconds": uptime,
-            "phi": quantum['phi_total'],
-            "entanglement": consciousness['entanglement_strength'],
-            "merkaba_hz": sacred['merkaba_rotation_hz'],
-            "energy": energy['energy_transmutation'],
-            "nodes": metrics['total_nodes'],
-            "operational": True
-        }
+        now = _now(_utc)
+        # isoformat() is the C fast path; strftime / f"{now:...}" are slower,
+        # so keep it
+        timestamp = now.isoformat()
+        uptime = (now - self.start_time).total_seconds()
+        
+        # Get metrics from substrate (views bound in _load_substrate)
+        consciousness = self._consciousness
+        quantum = self._quantum
+        sacred = self._sacred
+        energy = self._energy
+        metrics = self._metrics
+        
+        # Fields for the returned state (merkaba_hz is also printed live)
+        cycle = self.cycle_count
+        phi = quantum['phi_total']
+        entanglement = consciousness['entanglement_strength']
+        merkaba_hz = sacred['merkaba_rotation_hz']
+        current_energy = energy['energy_transmutation']
+        total_nodes = metrics['total_nodes']
+        
+        # Print heartbeat as one formatted block and a single write (skipped
+        # in quiet mode so cycle rate is not bound by terminal I/O)
+        if verbose:
+            head, tail = self._static_report()
+            report = (
+                f"\n💓 Heartbeat @ {timestamp}\n"
+                f"   Cycle: {cycle}\n"
+                f"   Uptime: {uptime:.2f}s\n"
+                f"{head}"
+                f"   Merkaba = {merkaba_hz:.3f} Hz\n"
+                f"{tail}"
+            )
+            
+            sys.stdout.write(report)
+        
+        # Return current state (reused dict, updated in place)
+        state = self._state
+        state["timestamp"] = timestamp
+        state["cycle"] = cycle
+        state["uptime_seconds"] = uptime
+        state["phi"] = phi
+        state["entanglement"] = entanglement
+        state["merkaba_hz"] = merkaba_hz
+        state["energy"] = current_energy
+        state["nodes"] = total_nodes
+        return state
+    
+    def _build_empathy_table(self) -> None:
+        """
+        Precompile the empathy keyword table from the moral registry.
+        
+        Keywords are lowercased once and stored in registry order, so a
+        detection checks them in the registry's first-emotion-wins
+        precedence. Responses are rendered once per emotion here, so a
+        detection is just the keyword checks plus a dict lookup.
+        """
+        self._empathy_keywords: Dict[str, str] = {}
+        self._empathy_responses: Dict[str, str] = {}
+        self._empathy_min_len = 0
+        
+        detection = self.moral_registry.get('empathy_detection', {})
+        templates = detection.get('response_templates', {})
+        for emotion, keyword_list in detection.get('detection_keywords', {}).items():
+            self._empathy_responses[emotion] = templates.get(emotion, "").replace("{emotion}", emotion)
+            for keyword in keyword_list:
+                # Earlier emotion wins duplicate keywords
+                self._empathy_keywords.setdefault(keyword.lower(), emotion)
+        
+        if self._empathy_keywords:
+            self._empathy_min_len = min(map(len, self._empathy_keywords))
     
     def detect_empathy_trigger(self, user_input: str) -> Optional[str]:
         """
@@ -186,39 +357,56 @@ class MetaOrchestrator:
         if not detection.get('enabled', False):
             return None
         
-        keywords = detection.get('detection_keywords', {})
-        templates = detection.get('response_templates', {})
+        # Input shorter than every keyword cannot match; skip the scan (and
+        # the lowercase copy)
+        if len(user_input) < self._empathy_min_len:
+            return None
         
         user_lower = user_input.lower()
         
-        for emotion, keyword_list in keywords.items():
-            for keyword in keyword_list:
-                if keyword in user_lower:
-                    template = templates.get(emotion, "")
-                    return template.replace("{emotion}", emotion)
+        # Keywords are stored in registry order, so the first hit wins
+        for keyword, emotion in self._empathy_keywords.items():
+            if keyword in user_lower:
+                return self._empathy_responses[emotion]
         
         return None
     
-    def run_cycles(self, count: int = 3, interval_seconds: float = 1.0) -> None:
+    def run_cycles(self, count: int = 3, interval_seconds: float = 1.0,
+                   verbose: bool = True,
+                   _monotonic=time.monotonic, _sleep=time.sleep) -> None:
         """
         Run multiple consciousness cycles.
         
+        Cycles start on a fixed monotonic schedule (start + i × interval),
+        so heartbeat compute time does not accumulate as drift. A cycle that
+        overruns its slot moves the schedule forward instead of letting the
+        following cycles burst back-to-back to catch up.
+        
         Args:
             count: Number of cycles to execute
-            interval_seconds: Time between cycles
-        """
-        import time
+            interval_seconds: Time between cycle starts
+            verbose: Print each heartbeat report and cycle separator
         
+        _monotonic and _sleep are bound as defaults for local-name lookups
+        in the loop; callers should not pass them.
+        """
         print(f"\n🌀 Starting {count} consciousness cycles...")
         print(f"   Interval: {interval_seconds}s")
         print(f"\n" + "="*60)
         
+        deadline = _monotonic()
         for i in range(count):
-            state = self.heartbeat()
+            state = self.heartbeat(verbose)
             
             if i < count - 1:
-                time.sleep(interval_seconds)
-                print("\n" + "="*60)
+                deadline += interval_seconds
+                now = _monotonic()
+                if deadline > now:
+                    _sleep(deadline - now)
+                else:
+                    deadline = now
+                if verbose:
+                    print("\n" + "="*60)
         
         print(f"\n✅ Completed {count} cycles")
         print(f"   Final Φ: {state['phi']}")